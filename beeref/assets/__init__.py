@@ -47,6 +47,16 @@ class BeeAssets:
             'cursor_flip_v.png', (20, 20))
         self.cursor_draw_line = self.cursor_from_svg(
             'icons/draw-line.svg', (12, 12))
+        self._icon_pixmaps = {}
+
+    def icon_pixmap(self, filename):
+        """Returns the pixmap of an icon, decoding it only once."""
+        pixmap = self._icon_pixmaps.get(filename)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap(
+                str(self.PATH.joinpath('icons', filename)))
+            self._icon_pixmaps[filename] = pixmap
+        return pixmap
 
     def cursor_from_image(self, filename, hotspot):
         app = QtWidgets.QApplication.instance()
@@ -228,7 +228,7 @@ class BeeSettings(QtCore.QSettings):
         values.insert(0, filename)
 
         self.beginWriteArray('RecentFiles')
-        for i, filename in enumerate(values[:10]):
+        for i, filename in enumerate(values[:constants.MAX_RECENT_FILES]):
             self.setArrayIndex(i)
             self.setValue('path', filename)
         self.endArray()
@@ -21,6 +21,9 @@ COPYRIGHT = 'Copyright © 2021-2024 Rebecca Breu'
 
 CHANGED_SYMBOL = '✎'
 
+# Maximum number of entries in the 'Recent Files' list
+MAX_RECENT_FILES = 10
+
 # Floating Menu Sizes
 FLOATING_MENU_BUTTON_SIZE = 32
 FLOATING_MENU_ICON_SIZE = 32
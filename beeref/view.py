@@ -13,7 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with BeeRef.  If not, see <https://www.gnu.org/licenses/>.
 
-from functools import partial
+from functools import lru_cache, partial
 from typing import Optional
 import logging
 import os
@@ -46,6 +46,18 @@ commandline_args = CommandlineArgs()
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _supported_image_formats(cls):
+    # The loaded image plugins don't change at runtime, so the
+    # formats only need to be queried once per reader/writer class
+    formats = []
+
+    for f in cls.supportedImageFormats():
+        string = f'*.{f.data().decode()}'
+        formats.extend((string, string.upper()))
+    return ' '.join(formats)
+
+
 class BeeGraphicsView(MainControlsMixin,
                       QtWidgets.QGraphicsView,
                       ActionsMixin):
@@ -64,7 +76,8 @@ class BeeGraphicsView(MainControlsMixin,
         self.welcome_overlay = widgets.welcome_overlay.WelcomeOverlay(self)
 
         self.image_floating_menu: Optional[ImageFloatingMenu] = None
-        self.text_floating_menu: Optional[TextFloatingMenu] = None
+        self._text_floating_menu: Optional[TextFloatingMenu] = None
+        self._floating_menus_parent: Optional[QtWidgets.QWidget] = None
         self.gif_floating_menu: Optional[GifFloatingMenu] = None
         self.draw_floating_menu: Optional[DrawFloatingMenu] = None
         
@@ -88,6 +101,7 @@ class BeeGraphicsView(MainControlsMixin,
         self.filename = None
         self.previous_transform = None
         self.active_mode = None
+        self.loading = False
 
         self.scene = BeeGraphicsScene(self.undo_stack)
         self.scene.changed.connect(self.on_scene_changed)
@@ -169,16 +183,25 @@ class BeeGraphicsView(MainControlsMixin,
         self.parent.setWindowTitle(title)
 
     def _init_floating_menus(self, parent: QtWidgets.QWidget) -> None:
+        self._floating_menus_parent = parent
         self.image_floating_menu = ImageFloatingMenu(parent, self)
-        self.text_floating_menu = TextFloatingMenu(parent, self)
         self.gif_floating_menu = GifFloatingMenu(parent, self)
         self.draw_floating_menu = DrawFloatingMenu(parent, self)
 
+    @property
+    def text_floating_menu(self) -> Optional[TextFloatingMenu]:
+        """Text menu, created on first text item selection."""
+        if (self._text_floating_menu is None
+                and self._floating_menus_parent is not None):
+            self._text_floating_menu = TextFloatingMenu(
+                self._floating_menus_parent, self)
+        return self._text_floating_menu
+
     def _floating_menus(self):
         return [
             menu
-            for menu in (self.image_floating_menu, self.text_floating_menu, 
-                        self.gif_floating_menu, self.draw_floating_menu)
+            for menu in (self.image_floating_menu, self._text_floating_menu,
+                         self.gif_floating_menu, self.draw_floating_menu)
             if menu is not None
         ]
 
@@ -224,9 +247,9 @@ class BeeGraphicsView(MainControlsMixin,
             return
         item = self.scene.selectedItems(user_only=True)[0]
         if (isinstance(item, BeeTextItem)
-                and self.text_floating_menu
-                and self.text_floating_menu.isVisible()):
-            self.text_floating_menu.show_for_item(item)
+                and self._text_floating_menu
+                and self._text_floating_menu.isVisible()):
+            self._text_floating_menu.show_for_item(item)
         elif (isinstance(item, BeeGifItem)
               and self.gif_floating_menu
               and self.gif_floating_menu.isVisible()):
@@ -246,7 +269,9 @@ class BeeGraphicsView(MainControlsMixin,
             self.setTransform(QtGui.QTransform())
             self.welcome_overlay.setFocus()
             self.clearFocus()
-            self.welcome_overlay.show()
+            if not self.loading:
+                # Don't build the overlay just to cover a scene being loaded
+                self.welcome_overlay.show()
             self.actiongroup_set_enabled('active_when_items_in_scene', False)
             self._hide_all_floating_menus()
         else:
@@ -269,12 +294,7 @@ class BeeGraphicsView(MainControlsMixin,
         self.context_menu.exec(self.mapToGlobal(point))
 
     def get_supported_image_formats(self, cls):
-        formats = []
-
-        for f in cls.supportedImageFormats():
-            string = f'*.{f.data().decode()}'
-            formats.extend((string, string.upper()))
-        return ' '.join(formats)
+        return _supported_image_formats(cls)
 
     def get_view_center(self):
         return QtCore.QPoint(round(self.size().width() / 2),
@@ -1117,6 +1137,7 @@ class BeeGraphicsView(MainControlsMixin,
         self.scene.add_queued_items()
 
     def on_loading_finished(self, filename, errors):
+        self.loading = False
         if errors:
             QtWidgets.QMessageBox.warning(
                 self,
@@ -1127,6 +1148,8 @@ class BeeGraphicsView(MainControlsMixin,
             self.filename = filename
             self.scene.add_queued_items()
             self.on_action_fit_scene()
+        if not self.scene.items():
+            self.on_scene_changed(None)
 
     def on_action_open_recent_file(self, filename):
         confirm = self.get_confirmation_unsaved_changes(
@@ -1146,6 +1169,7 @@ class BeeGraphicsView(MainControlsMixin,
             f'Loading {filename}',
             worker=self.worker,
             parent=self)
+        self.loading = True
         self.worker.start()
 
     def on_action_open(self):
@@ -1318,6 +1342,7 @@ class BeeGraphicsView(MainControlsMixin,
         """
 
         logger.debug('Insert images finished')
+        self.loading = False
         if errors:
             errornames = [
                 f'<li>{fn}</li>' for fn in errors]
@@ -1333,6 +1358,8 @@ class BeeGraphicsView(MainControlsMixin,
         self.undo_stack.endMacro()
         if new_scene:
             self.on_action_fit_scene()
+        if not self.scene.items():
+            self.on_scene_changed(None)
 
     def do_insert_images(self, filenames, pos=None):
         if not pos:
@@ -1352,6 +1379,7 @@ class BeeGraphicsView(MainControlsMixin,
             'Loading images',
             worker=self.worker,
             parent=self)
+        self.loading = True
         self.worker.start()
 
     def on_action_insert_images(self):
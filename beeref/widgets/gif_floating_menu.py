@@ -8,13 +8,22 @@ from typing import TYPE_CHECKING, Optional
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from beeref.assets import BeeAssets
+from beeref.gif_item import BeeGifItem
 from beeref.widgets.floating_menu import FloatingMenu
 
 logger = logging.getLogger(__name__)
 
+# Tooltip labels shared by all GIF menu buttons
+_TOOLTIP_SPEED = "Playback speed"
+_TOOLTIP_PREVIOUS_FRAME = "Previous frame"
+_TOOLTIP_PLAY_PAUSE = "Play/Pause"
+_TOOLTIP_PLAY = "Play"
+_TOOLTIP_PAUSE = "Pause"
+_TOOLTIP_NEXT_FRAME = "Next frame"
+_TOOLTIP_FRAMES = "Show frames timeline"
+
 if TYPE_CHECKING:  # pragma: no cover
     from beeref.view import BeeGraphicsView
-    from beeref.gif_item import BeeGifItem
     from beeref.widgets.gif_frames_menu import GifFramesMenu
 
 
@@ -25,26 +34,25 @@ class GifFloatingMenu(FloatingMenu):
 
     def __init__(self, parent: QtWidgets.QWidget, view: "BeeGraphicsView"):
         super().__init__(parent, view)
+        self._frames_menu: Optional["GifFramesMenu"] = None
         
-        self._init_frames_menu(parent, view)
         self._init_icons()
         self._init_speed_combobox()
         self._init_control_buttons()
 
-    def _init_frames_menu(
-        self, 
-        parent: QtWidgets.QWidget, 
-        view: "BeeGraphicsView"
-    ) -> None:
-        """Initializes frames menu."""
-        self.frames_menu: Optional["GifFramesMenu"] = None
-        try:
-            from beeref.widgets.gif_frames_menu import GifFramesMenu
-            self.frames_menu = GifFramesMenu(parent, view, self)
-        except ImportError as e:
-            logger.warning(f'Failed to import frames menu: {e}')
-        except Exception as e:
-            logger.warning(f'Failed to initialize frames menu: {e}')
+    @property
+    def frames_menu(self) -> Optional["GifFramesMenu"]:
+        """Frames menu, created on first access."""
+        if self._frames_menu is None:
+            try:
+                from beeref.widgets.gif_frames_menu import GifFramesMenu
+                self._frames_menu = GifFramesMenu(
+                    self._parent_widget, self.view, self)
+            except ImportError as e:
+                logger.warning(f'Failed to import frames menu: {e}')
+            except Exception as e:
+                logger.warning(f'Failed to initialize frames menu: {e}')
+        return self._frames_menu
 
     def _init_icons(self) -> None:
         """Loads icons for control buttons."""
@@ -74,7 +82,7 @@ class GifFloatingMenu(FloatingMenu):
         default_index = self.SPEED_VALUES.index(1.0)
         self.speed_combo.setCurrentIndex(default_index)
         self.speed_combo.currentIndexChanged.connect(self._on_speed_changed)
-        self.speed_combo.setToolTip("Playback speed")
+        self.speed_combo.setToolTip(_TOOLTIP_SPEED)
         self.add_widget(self.speed_combo)
 
     def _format_speed_label(self, speed: float) -> str:
@@ -92,28 +100,28 @@ class GifFloatingMenu(FloatingMenu):
             icon=self.prev_frame_icon,
             callback=self.on_previous_frame,
         )
-        self.prev_frame_btn.setToolTip("Previous frame")
+        self.prev_frame_btn.setToolTip(_TOOLTIP_PREVIOUS_FRAME)
 
         self.play_pause_btn = self.add_button(
             "",
             icon=self.play_icon,
             callback=self.on_toggle_play_pause,
         )
-        self.play_pause_btn.setToolTip("Play/Pause")
+        self.play_pause_btn.setToolTip(_TOOLTIP_PLAY_PAUSE)
 
         self.next_frame_btn = self.add_button(
             "",
             icon=self.next_frame_icon,
             callback=self.on_next_frame,
         )
-        self.next_frame_btn.setToolTip("Next frame")
+        self.next_frame_btn.setToolTip(_TOOLTIP_NEXT_FRAME)
 
         self.frames_btn = self.add_button(
             "",
             icon=self.frames_icon,
             callback=self.on_toggle_frames_menu,
         )
-        self.frames_btn.setToolTip("Show frames timeline")
+        self.frames_btn.setToolTip(_TOOLTIP_FRAMES)
 
     def show_for_item(self, item: "BeeGifItem") -> None:
         """Shows menu for specified GIF item."""
@@ -124,8 +132,8 @@ class GifFloatingMenu(FloatingMenu):
 
     def _hide_frames_menu(self) -> None:
         """Hides frames menu if it's open."""
-        if self.frames_menu:
-            self.frames_menu.hide_menu()
+        if self._frames_menu is not None:
+            self._frames_menu.hide_menu()
 
     def update_speed_combo(self) -> None:
         """Updates speed value in combobox."""
@@ -143,6 +151,7 @@ class GifFloatingMenu(FloatingMenu):
         self.speed_combo.setCurrentIndex(index)
         self.speed_combo.blockSignals(False)
 
+    @QtCore.pyqtSlot(int)
     def _on_speed_changed(self, index: int) -> None:
         """Handler for playback speed change."""
         if not self._has_gif_item():
@@ -159,48 +168,56 @@ class GifFloatingMenu(FloatingMenu):
         
         if self.current_item.is_playing:
             self.play_pause_btn.setIcon(self.pause_icon)
-            self.play_pause_btn.setToolTip("Pause")
+            self.play_pause_btn.setToolTip(_TOOLTIP_PAUSE)
         else:
             self.play_pause_btn.setIcon(self.play_icon)
-            self.play_pause_btn.setToolTip("Play")
+            self.play_pause_btn.setToolTip(_TOOLTIP_PLAY)
+
+    def _defer(self, slot_name: str) -> None:
+        """Queues slot invocation so button can process event first."""
+        QtCore.QMetaObject.invokeMethod(
+            self, slot_name, QtCore.Qt.ConnectionType.QueuedConnection)
 
     def on_toggle_play_pause(self) -> None:
         """Toggles GIF play/pause."""
         if not self._has_gif_item():
             return
-        
-        # Defer execution so button can process event
-        def do_toggle():
-            self.current_item.toggle_animation()
-            self.update_play_pause_button()
-        
-        QtCore.QTimer.singleShot(0, do_toggle)
+        self._defer('_do_toggle_play_pause')
+
+    @QtCore.pyqtSlot()
+    def _do_toggle_play_pause(self) -> None:
+        if not self._has_gif_item():
+            return
+        self.current_item.toggle_animation()
+        self.update_play_pause_button()
 
     def on_previous_frame(self) -> None:
         """Goes to previous frame."""
         if not self._has_gif_item():
             return
-        
-        # Defer execution so button can process event
-        def do_previous():
-            self.current_item.previous_frame()
-            self.update_play_pause_button()
-            self._update_frames_menu_if_visible()
-        
-        QtCore.QTimer.singleShot(0, do_previous)
+        self._defer('_do_previous_frame')
+
+    @QtCore.pyqtSlot()
+    def _do_previous_frame(self) -> None:
+        if not self._has_gif_item():
+            return
+        self.current_item.previous_frame()
+        self.update_play_pause_button()
+        self._update_frames_menu_if_visible()
 
     def on_next_frame(self) -> None:
         """Goes to next frame."""
         if not self._has_gif_item():
             return
-        
-        # Defer execution so button can process event
-        def do_next():
-            self.current_item.next_frame()
-            self.update_play_pause_button()
-            self._update_frames_menu_if_visible()
-        
-        QtCore.QTimer.singleShot(0, do_next)
+        self._defer('_do_next_frame')
+
+    @QtCore.pyqtSlot()
+    def _do_next_frame(self) -> None:
+        if not self._has_gif_item():
+            return
+        self.current_item.next_frame()
+        self.update_play_pause_button()
+        self._update_frames_menu_if_visible()
 
     def on_toggle_frames_menu(self) -> None:
         """Toggles frames menu visibility."""
@@ -218,15 +235,15 @@ class GifFloatingMenu(FloatingMenu):
         """Updates position of menu and frames menu."""
         super().update_position()
         
-        if self.frames_menu and self.frames_menu.isVisible():
-            self.frames_menu.update_position()
+        if self._frames_menu is not None and self._frames_menu.isVisible():
+            self._frames_menu.update_position()
 
     def _has_gif_item(self) -> bool:
         """Checks if current item is a GIF item."""
-        return (self.current_item is not None and 
-                hasattr(self.current_item, 'is_playing'))
+        return isinstance(self.current_item, BeeGifItem)
 
     def _update_frames_menu_if_visible(self) -> None:
-        """Updates frames menu if it's visible."""
-        if self.frames_menu and self.frames_menu.isVisible():
-            self.frames_menu.load_frames(self.current_item)
+        """Updates selected frame in frames menu if it's visible."""
+        if self._frames_menu is not None and self._frames_menu.isVisible():
+            self._frames_menu.update_selected_frame(
+                self.current_item.current_frame)
@@ -16,120 +16,266 @@ if TYPE_CHECKING:  # pragma: no cover
 logger = logging.getLogger(__name__)
 
 
-class GifFrameThumbnail(QtWidgets.QWidget):
-    """Widget for displaying a single GIF frame."""
-    
-    FRAME_SIZE = 96  # Thumbnail size
-    
-    def __init__(self, frame_number: int, pixmap: QtGui.QPixmap, 
-                 delay_ms: int, frames_menu: "GifFramesMenu", parent=None):
+# Colors are static, so the stylesheets only need to be built once
+_FRAMES_VIEW_STYLESHEET = """
+    QListView {
+        border: 1px solid rgba(255, 255, 255, 40);
+        border-radius: 4px;
+        background-color: rgba(40, 40, 40, 240);
+    }
+    QScrollBar:horizontal {
+        height: 8px;
+        background: rgba(60, 60, 60, 200);
+        border-radius: 4px;
+    }
+    QScrollBar::handle:horizontal {
+        background: rgba(140, 140, 140, 200);
+        border-radius: 4px;
+        min-width: 20px;
+    }
+    QScrollBar::handle:horizontal:hover {
+        background: rgba(180, 180, 180, 200);
+    }
+"""
+
+
+def _frames_menu_stylesheet() -> str:
+    bg_r, bg_g, bg_b = constants.COLORS['Active:Window'][:3]
+    border_r, border_g, border_b = constants.COLORS['Active:Base'][:3]
+    return f"""
+        QWidget#GifFramesMenu {{
+            background-color: rgba({bg_r}, {bg_g}, {bg_b}, 255);
+            border-radius: 8px;
+            border: 1px solid rgba({border_r}, {border_g}, {border_b}, 255);
+        }}
+    """
+
+
+_FRAMES_MENU_STYLESHEET = _frames_menu_stylesheet()
+
+
+def get_frame_thumbnail(item: "BeeGifItem", frame_num: int,
+                        pixmap: QtGui.QPixmap, size: int) -> QtGui.QPixmap:
+    """Returns scaled frame thumbnail, shared through QPixmapCache."""
+    key = f'gif:{id(item)}:{frame_num}:{pixmap.cacheKey()}:{size}'
+    thumbnail = QtGui.QPixmapCache.find(key)
+    if thumbnail is None:
+        thumbnail = pixmap.scaled(
+            size, size,
+            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+            QtCore.Qt.TransformationMode.SmoothTransformation
+        )
+        QtGui.QPixmapCache.insert(key, thumbnail)
+    return thumbnail
+
+
+class GifFramesModel(QtCore.QAbstractListModel):
+    """Frames of a GIF, one row per frame."""
+
+    SelectedRole = QtCore.Qt.ItemDataRole.UserRole
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.frame_number = frame_number
-        self.pixmap = pixmap
-        self.delay_ms = delay_ms
-        self.is_selected = False
-        self.frames_menu = frames_menu  # Keep reference to frames menu
-        
-        self.setFixedSize(self.FRAME_SIZE + 8, self.FRAME_SIZE + 24)
-        self.setToolTip(f"Frame: {frame_number}\nDelay: {delay_ms / 1000:.2f}s")
-        self.drag_start_position = None
-        self.is_dragging = False
-        
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
+        self.pixmaps: list[QtGui.QPixmap] = []
+        self.thumbnails: list[QtGui.QPixmap] = []
+        self.delays: list[int] = []
+        self.selected_frame = -1
+
+    def set_frames(self, pixmaps, thumbnails, delays, selected_frame):
+        self.beginResetModel()
+        self.pixmaps = pixmaps
+        self.thumbnails = thumbnails
+        self.delays = delays
+        self.selected_frame = selected_frame
+        self.endResetModel()
+
+    def clear(self):
+        """Drops all frames in a single model reset."""
+        self.set_frames([], [], [], -1)
+
+    def set_selected_frame(self, frame_index: int):
+        """Moves selection, only notifying the two affected rows."""
+        old = self.selected_frame
+        if old == frame_index:
+            return
+        self.selected_frame = frame_index
+        for row in (old, frame_index):
+            if 0 <= row < len(self.pixmaps):
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [self.SelectedRole])
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.pixmaps)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == QtCore.Qt.ItemDataRole.DecorationRole:
+            return self.thumbnails[row]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return str(row + 1)
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return f"Frame: {row + 1}\nDelay: {self.delays[row] / 1000:.2f}s"
+        if role == self.SelectedRole:
+            return row == self.selected_frame
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and not self.pixmaps[index.row()].isNull():
+            flags |= QtCore.Qt.ItemFlag.ItemIsDragEnabled
+        return flags
+
+    def mimeTypes(self):
+        return ['application/x-qt-image']
+
+    def mimeData(self, indexes):
+        mime_data = QtCore.QMimeData()
+        if indexes:
+            mime_data.setImageData(self.pixmaps[indexes[0].row()].toImage())
+        return mime_data
+
+
+class GifFrameDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints a frame thumbnail with its number and selection border."""
+
+    FRAME_SIZE = 96  # Thumbnail size
+
+    def sizeHint(self, option, index):
+        return QtCore.QSize(self.FRAME_SIZE + 8, self.FRAME_SIZE + 24)
+
+    @classmethod
+    def thumbnail_rect(cls, rect: QtCore.QRect) -> QtCore.QRect:
+        return QtCore.QRect(rect.x() + 4, rect.y() + 4,
+                            cls.FRAME_SIZE, cls.FRAME_SIZE)
+
+    @classmethod
+    def text_rect(cls, rect: QtCore.QRect) -> QtCore.QRect:
+        return QtCore.QRect(
+            rect.x(), rect.y() + cls.FRAME_SIZE + 8, rect.width(), 16)
+
+    @classmethod
+    def selection_region(cls, rect: QtCore.QRect) -> QtGui.QRegion:
+        """The thin frame covered by the selection border."""
+        outer = QtCore.QRect(rect.x(), rect.y(),
+                             cls.FRAME_SIZE + 8, cls.FRAME_SIZE + 8)
+        return QtGui.QRegion(outer).subtracted(
+            QtGui.QRegion(cls.thumbnail_rect(rect)))
+
+    def paint(self, painter, option, index):
+        painter.save()
+        rect = option.rect
         painter.setRenderHint(QtGui.QPainter.RenderHint.SmoothPixmapTransform)
-        
+        # Region being repainted; lets a selection-only update skip
+        # the thumbnail and the text
+        dirty = getattr(option.widget, 'paint_region', None)
+
         # Selection border
-        if self.is_selected:
+        if index.data(GifFramesModel.SelectedRole):
             pen = QtGui.QPen(QtGui.QColor(*constants.COLORS['Scene:Selection']))
             pen.setWidth(3)
             painter.setPen(pen)
             painter.setBrush(QtGui.QBrush())
-            painter.drawRect(2, 2, self.FRAME_SIZE + 4, self.FRAME_SIZE + 4)
-        
+            painter.drawRect(rect.x() + 2, rect.y() + 2,
+                             self.FRAME_SIZE + 4, self.FRAME_SIZE + 4)
+
         # Frame thumbnail
-        scaled_pixmap = self.pixmap.scaled(
-            self.FRAME_SIZE, self.FRAME_SIZE,
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation
-        )
-        x = (self.width() - scaled_pixmap.width()) // 2
-        y = 4
-        painter.drawPixmap(x, y, scaled_pixmap)
-        
+        thumbnail_rect = self.thumbnail_rect(rect)
+        if dirty is None or dirty.intersects(thumbnail_rect):
+            thumbnail = index.data(QtCore.Qt.ItemDataRole.DecorationRole)
+            if thumbnail is not None and not thumbnail.isNull():
+                x = rect.x() + (rect.width() - thumbnail.width()) // 2
+                painter.drawPixmap(x, rect.y() + 4, thumbnail)
+
         # Frame number
-        painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255)))
-        font = painter.font()
-        font.setPointSize(8)
-        painter.setFont(font)
-        text_rect = QtCore.QRect(0, self.FRAME_SIZE + 8, self.width(), 16)
-        painter.drawText(text_rect, QtCore.Qt.AlignmentFlag.AlignCenter, 
-                        str(self.frame_number))
-    
-    def mousePressEvent(self, event):
-        if event.button() == QtCore.Qt.MouseButton.LeftButton:
-            # Save drag start position
-            self.drag_start_position = event.position().toPoint()
-            self.is_dragging = False
-        super().mousePressEvent(event)
-    
-    def mouseMoveEvent(self, event):
-        """Handles start of frame dragging."""
-        if not (event.buttons() & QtCore.Qt.MouseButton.LeftButton):
+        text_rect = self.text_rect(rect)
+        if dirty is None or dirty.intersects(text_rect):
+            painter.setPen(QtGui.QPen(QtGui.QColor(255, 255, 255)))
+            font = painter.font()
+            font.setPointSize(8)
+            painter.setFont(font)
+            painter.drawText(text_rect, QtCore.Qt.AlignmentFlag.AlignCenter,
+                             index.data(QtCore.Qt.ItemDataRole.DisplayRole))
+        painter.restore()
+
+
+class GifFramesView(QtWidgets.QListView):
+    """Horizontal strip of frames; only visible frames get painted."""
+
+    SCROLLBAR_HEIGHT = 8
+    DRAG_PREVIEW_SIZE = 128
+
+    def __init__(self, frames_menu: "GifFramesMenu", parent=None):
+        super().__init__(parent)
+        self.frames_menu = frames_menu
+        self.setFlow(QtWidgets.QListView.Flow.LeftToRight)
+        self.setWrapping(False)
+        self.setUniformItemSizes(True)
+        self.setSpacing(2)
+        self.setHorizontalScrollMode(
+            QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(
+            QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(
+            QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setEditTriggers(
+            QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setSelectionMode(
+            QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.setDragEnabled(True)
+        self.setDragDropMode(
+            QtWidgets.QAbstractItemView.DragDropMode.DragOnly)
+        self.setItemDelegate(GifFrameDelegate(self))
+        self.paint_region: Optional[QtGui.QRegion] = None
+        cell_height = GifFrameDelegate.FRAME_SIZE + 24
+        self.setFixedHeight(
+            cell_height + 2 * self.spacing() + self.SCROLLBAR_HEIGHT + 4)
+        self.clicked.connect(self.on_clicked)
+
+    def dataChanged(self, top_left, bottom_right, roles=()):
+        if list(roles) != [GifFramesModel.SelectedRole]:
+            super().dataChanged(top_left, bottom_right, roles)
             return
-        
-        if self.drag_start_position is None:
+        # Only the selection changed: repaint just the border strips
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            rect = self.visualRect(self.model().index(row))
+            if rect.isValid():
+                self.viewport().update(
+                    GifFrameDelegate.selection_region(rect))
+
+    def paintEvent(self, event):
+        self.paint_region = event.region()
+        try:
+            super().paintEvent(event)
+        finally:
+            self.paint_region = None
+
+    def on_clicked(self, index):
+        """Handles frame click (if no dragging occurred)."""
+        self.frames_menu.select_frame(index.row() + 1)
+
+    def startDrag(self, supported_actions):
+        """Drags the full size frame as image data."""
+        index = self.currentIndex()
+        if not index.isValid():
             return
-        
-        # Check if mouse moved enough to start drag
-        if ((event.position().toPoint() - self.drag_start_position).manhattanLength() 
-                < QtWidgets.QApplication.startDragDistance()):
+        model = self.model()
+        pixmap = model.pixmaps[index.row()]
+        if pixmap.isNull():
             return
-        
-        # Mark that dragging has started
-        self.is_dragging = True
-        
-        # Create QDrag object
+
         drag = QtGui.QDrag(self)
-        mime_data = QtCore.QMimeData()
-        
-        # Convert pixmap to QImage for drag transfer
-        image = self.pixmap.toImage()
-        mime_data.setImageData(image)
-        
-        drag.setMimeData(mime_data)
-        
-        # Set visual representation during drag
-        # Use original pixmap but scaled down for preview
-        preview_pixmap = self.pixmap.scaled(
-            128, 128,
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation
-        )
+        drag.setMimeData(model.mimeData([index]))
+        # Set visual representation during drag, cached like the thumbnails
+        preview_pixmap = get_frame_thumbnail(
+            self.frames_menu.current_item, index.row(), pixmap,
+            self.DRAG_PREVIEW_SIZE)
         drag.setPixmap(preview_pixmap)
-        drag.setHotSpot(event.position().toPoint() - self.drag_start_position)
-        
-        # Start drag operation
+        drag.setHotSpot(QtCore.QPoint(preview_pixmap.width() // 2,
+                                      preview_pixmap.height() // 2))
         drag.exec(QtCore.Qt.DropAction.CopyAction)
-        
-        # Reset state after drag completion
-        self.drag_start_position = None
-        self.is_dragging = False
-        
-        super().mouseMoveEvent(event)
-    
-    def mouseReleaseEvent(self, event):
-        """Handles frame click (if no dragging occurred)."""
-        if (event.button() == QtCore.Qt.MouseButton.LeftButton 
-                and not self.is_dragging 
-                and self.drag_start_position is not None):
-            # If no dragging occurred, select frame
-            if self.frames_menu:
-                self.frames_menu.select_frame(self.frame_number)
-        
-        self.drag_start_position = None
-        self.is_dragging = False
-        super().mouseReleaseEvent(event)
 
 
 class GifFramesMenu(QtWidgets.QWidget):
@@ -153,117 +299,62 @@ class GifFramesMenu(QtWidgets.QWidget):
         self.current_item: Optional["BeeGifItem"] = None
         
         # Cache for update_position optimization
-        self._cached_position: Optional[QtCore.QPoint] = None
+        self._cached_geometry: Optional[QtCore.QRect] = None
         self._cached_viewport_size: Optional[QtCore.QSize] = None
         self._cached_gif_menu_pos: Optional[QtCore.QPoint] = None
+        self._cached_gif_menu_size: Optional[QtCore.QSize] = None
         
         # Layout
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(4)
         
-        # Scroll area for frames
-        scroll_area = QtWidgets.QScrollArea(self)
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(
-            QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(
-            QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: 1px solid rgba(255, 255, 255, 40);
-                border-radius: 4px;
-                background-color: rgba(40, 40, 40, 240);
-            }
-            QScrollBar:horizontal {
-                height: 8px;
-                background: rgba(60, 60, 60, 200);
-                border-radius: 4px;
-            }
-            QScrollBar::handle:horizontal {
-                background: rgba(140, 140, 140, 200);
-                border-radius: 4px;
-                min-width: 20px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: rgba(180, 180, 180, 200);
-            }
-        """)
-        
-        # Container for frames
-        self.frames_container = QtWidgets.QWidget()
-        self.frames_layout = QtWidgets.QHBoxLayout(self.frames_container)
-        self.frames_layout.setContentsMargins(4, 4, 4, 4)
-        self.frames_layout.setSpacing(4)
-        
-        scroll_area.setWidget(self.frames_container)
-        layout.addWidget(scroll_area)
+        # Frames strip
+        self.frames_model = GifFramesModel(self)
+        self.frames_view = GifFramesView(self, self)
+        self.frames_view.setModel(self.frames_model)
+        self.frames_view.setStyleSheet(_FRAMES_VIEW_STYLESHEET)
+        layout.addWidget(self.frames_view)
         
         # Apply rounded style like other floating panels
-        bg = constants.COLORS['Active:Window']
-        border = constants.COLORS['Active:Base']
-        bg_r, bg_g, bg_b = bg[:3]
-        border_r, border_g, border_b = border[:3]
-        self.setStyleSheet(f"""
-            QWidget#GifFramesMenu {{
-                background-color: rgba({bg_r}, {bg_g}, {bg_b}, 255);
-                border-radius: 8px;
-                border: 1px solid rgba({border_r}, {border_g}, {border_b}, 255);
-            }}
-        """)
+        self.setStyleSheet(_FRAMES_MENU_STYLESHEET)
         self.hide()
-        
-        self.frame_widgets = []
     
     def load_frames(self, item: "BeeGifItem"):
         """Loads all frames from GIF."""
         self.current_item = item
-        self.frame_widgets.clear()
-        
-        # Clear old widgets
-        while self.frames_layout.count():
-            child = self.frames_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
+
         if not item.movie or item.frame_count == 0:
+            self.frames_model.clear()
             return
         
-        # Save current frame
-        current_frame = item.current_frame
-        was_playing = item.is_playing
-        if was_playing:
-            item.pause_animation()
-        
-        # Load all frames
+        # Frames were already decoded when the GIF was loaded, so use
+        # the item's cache instead of seeking through the movie again
+        pixmaps = []
+        thumbnails = []
+        delays = []
         for frame_num in range(item.frame_count):
-            if item.movie.jumpToFrame(frame_num):
-                pixmap = item.movie.currentPixmap()
-                if not pixmap.isNull():
-                    # Get frame delay (in milliseconds)
-                    delay_ms = item.movie.nextFrameDelay()
-                    if delay_ms <= 0:
-                        delay_ms = 100  # Default value
-                    
-                    frame_widget = GifFrameThumbnail(
-                        frame_num + 1, pixmap, delay_ms, self, self.frames_container)
-                    frame_widget.is_selected = (frame_num == current_frame)
-                    self.frames_layout.addWidget(frame_widget)
-                    self.frame_widgets.append(frame_widget)
-        
-        # Restore current frame
-        if item.movie.jumpToFrame(current_frame):
-            item.current_frame = current_frame
-            pixmap = item.movie.currentPixmap()
+            pixmap = item.get_frame_pixmap(frame_num) or QtGui.QPixmap()
+            thumbnail = QtGui.QPixmap()
             if not pixmap.isNull():
-                item.setPixmap(pixmap)
-        
-        if was_playing:
-            item.play_animation()
+                thumbnail = get_frame_thumbnail(
+                    item, frame_num, pixmap, GifFrameDelegate.FRAME_SIZE)
+            # Get frame delay (in milliseconds)
+            delay_ms = item.get_frame_delay(frame_num)
+            if delay_ms <= 0:
+                delay_ms = 100  # Default value
+            pixmaps.append(pixmap)
+            thumbnails.append(thumbnail)
+            delays.append(delay_ms)
+        self.frames_model.set_frames(
+            pixmaps, thumbnails, delays, item.current_frame)
         
-        self.frames_container.adjustSize()
         self.adjustSize()
     
+    def update_selected_frame(self, frame_index: int):
+        """Moves the selection highlight without reloading any frames."""
+        self.frames_model.set_selected_frame(frame_index)
+
     def select_frame(self, frame_number: int):
         """Selects frame and displays it in item."""
         if not self.current_item or not self.current_item.movie:
@@ -271,10 +362,8 @@ class GifFramesMenu(QtWidgets.QWidget):
         
         frame_index = frame_number - 1  # Frame numbers start from 1
         
-        # Update selection in widgets
-        for i, widget in enumerate(self.frame_widgets):
-            widget.is_selected = (i == frame_index)
-            widget.update()
+        # Update selection in frames strip
+        self.update_selected_frame(frame_index)
         
         # Go to selected frame in item
         was_playing = self.current_item.is_playing
@@ -297,17 +386,17 @@ class GifFramesMenu(QtWidgets.QWidget):
             return
         
         # Reset cache when showing menu to ensure position update
-        self._cached_position = None
+        self._cached_geometry = None
         self._cached_viewport_size = None
         self._cached_gif_menu_pos = None
+        self._cached_gif_menu_size = None
         
-        self.adjustSize()
         self.show()
-        self.raise_()
         self.update_position()
         self.raise_()
         # Activate window to ensure it receives events
-        self.activateWindow()
+        if not self.isActiveWindow():
+            self.activateWindow()
     
     def update_position(self):
         """Updates menu position above main GIF menu with optimization."""
@@ -325,40 +414,35 @@ class GifFramesMenu(QtWidgets.QWidget):
         view_rect = viewport.rect()
         viewport_size = view_rect.size()
         
-        # Get GIF menu position in global coordinates (both are independent windows)
+        # Get GIF menu geometry in global coordinates
+        # (both are independent windows)
         gif_menu_pos = None
+        gif_menu_size = None
         if self.gif_menu.isVisible():
             gif_menu_pos = self.gif_menu.pos()  # Already in global coordinates
-        
-        # Check if viewport size or GIF menu position changed
-        if (self._cached_viewport_size is not None and 
-            self._cached_viewport_size == viewport_size and
-            self._cached_gif_menu_pos == gif_menu_pos and
-            self._cached_position is not None):
-            # If nothing changed, check current position
-            current_pos = self.pos()
-            if current_pos == self._cached_position:
-                # Position hasn't changed, skip update
-                return
+            gif_menu_size = self.gif_menu.size()
+
+        # Skip all geometry work if nothing we depend on has changed
+        if (self._cached_geometry is not None and
+                self._cached_viewport_size == viewport_size and
+                self._cached_gif_menu_pos == gif_menu_pos and
+                self._cached_gif_menu_size == gif_menu_size and
+                self.geometry() == self._cached_geometry):
+            return
         
         # Calculate available width from viewport (in global coordinates)
         bottom_left_global = viewport.mapToGlobal(view_rect.bottomLeft())
         bottom_right_global = viewport.mapToGlobal(view_rect.bottomRight())
         available_width = bottom_right_global.x() - bottom_left_global.x()
         
-        # Set full width only if it changed
-        if self.width() != available_width:
-            self.setFixedWidth(available_width)
-        
-        # Get natural content height
-        self.adjustSize()
-        height = self.height()
+        # Natural content height from layout, no extra layout pass needed
+        height = self.sizeHint().height()
         
         # Position above main GIF menu with 8px offset
         if self.gif_menu.isVisible() and gif_menu_pos is not None:
             # Center frames menu above gif_menu
-            gif_menu_width = self.gif_menu.width()
-            frames_menu_width = self.width()
+            gif_menu_width = gif_menu_size.width()
+            frames_menu_width = available_width
             # Center frames menu relative to gif_menu
             x = gif_menu_pos.x() + (gif_menu_width - frames_menu_width) // 2
             y = gif_menu_pos.y() - height - 8  # Above with 8px gap
@@ -371,18 +455,19 @@ class GifFramesMenu(QtWidgets.QWidget):
         if y < 0:
             if self.gif_menu.isVisible() and gif_menu_pos is not None:
                 # If doesn't fit above, position below gif_menu
-                y = gif_menu_pos.y() + self.gif_menu.height() + 8
+                y = gif_menu_pos.y() + gif_menu_size.height() + 8
             else:
                 y = 8
         
-        new_position = QtCore.QPoint(x, y)
+        new_geometry = QtCore.QRect(x, y, available_width, height)
         
-        # Update position only if it actually changed
-        if self._cached_position != new_position:
-            self.move(new_position)
-            self._cached_position = new_position
-            self._cached_viewport_size = viewport_size
-            self._cached_gif_menu_pos = gif_menu_pos
+        # Move and resize in one call, only if it actually changed
+        if self.geometry() != new_geometry:
+            self.setGeometry(new_geometry)
+        self._cached_geometry = new_geometry
+        self._cached_viewport_size = viewport_size
+        self._cached_gif_menu_pos = gif_menu_pos
+        self._cached_gif_menu_size = gif_menu_size
     
     def parentWidget(self):
         """Override to return stored parent widget for compatibility."""
@@ -391,10 +476,13 @@ class GifFramesMenu(QtWidgets.QWidget):
     def hide_menu(self):
         """Hides menu."""
         self.current_item = None
+        # Release frames of the hidden GIF all at once
+        self.frames_model.clear()
         # Clear cache when hiding menu
-        self._cached_position = None
+        self._cached_geometry = None
         self._cached_viewport_size = None
         self._cached_gif_menu_pos = None
+        self._cached_gif_menu_size = None
         self.hide()
     
     def toggle_menu(self, item: "BeeGifItem"):
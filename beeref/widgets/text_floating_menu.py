@@ -14,25 +14,69 @@ if TYPE_CHECKING:
     from beeref.items import BeeTextItem
 
 
+# Installed font families, enumerated once per process
+_FAMILIES_CACHE: list[str] | None = None
+
+
+def _get_families() -> list[str]:
+    global _FAMILIES_CACHE
+    if _FAMILIES_CACHE is None:
+        _FAMILIES_CACHE = QtGui.QFontDatabase.families()
+    return _FAMILIES_CACHE
+
+
+def _normalize_family(name: str) -> str:
+    return name.strip().casefold().replace(' ', '')
+
+
+class _FontIconProxy(QtCore.QIdentityProxyModel):
+    """Decorates every font family row with the same icon."""
+
+    def __init__(self, icon: QtGui.QIcon, parent=None):
+        super().__init__(parent)
+        self._icon = icon
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role == QtCore.Qt.ItemDataRole.DecorationRole:
+            return self._icon
+        return super().data(index, role)
+
+
 class TextFloatingMenu(FloatingMenu):
     """Contextual floating toolbar for text items."""
 
     FONT_SIZES = [8, 10, 12, 14, 16, 18, 24, 32, 48]
+    _SIZE_INDEX = {size: i for i, size in enumerate(FONT_SIZES)}
+
+    ICON_SIZE = QtCore.QSize(32, 32)
+
+    # Icons are shared by all instances, keyed by file name
+    _ICON_CACHE: dict[str, QtGui.QIcon] = {}
 
     def __init__(self, parent: QtWidgets.QWidget, view: "BeeGraphicsView"):
         super().__init__(parent, view)
 
+        # Last applied "active" state of the color buttons
+        self._text_color_active: bool | None = None
+        self._bg_active: bool | None = None
+        # Requested state, applied once per event loop turn
+        self._pending_colors: tuple[bool, bool] | None = None
+        self._color_refresh_timer = QtCore.QTimer(self)
+        self._color_refresh_timer.setSingleShot(True)
+        self._color_refresh_timer.setInterval(0)
+        self._color_refresh_timer.timeout.connect(self._apply_color_refresh)
+        # Item and formatting the controls were last refreshed for
+        self._last_state: tuple | None = None
+
         # Load icons
-        assets = BeeAssets()
-        icons_path = assets.PATH.joinpath('icons')
-        text_color_icon = QtGui.QIcon(str(icons_path.joinpath('format-color-text.svg')))
-        palette_icon = QtGui.QIcon(str(icons_path.joinpath('palette.svg')))
-        bold_icon = QtGui.QIcon(str(icons_path.joinpath('format-bold.svg')))
-        italic_icon = QtGui.QIcon(str(icons_path.joinpath('format-italic.svg')))
-        underline_icon = QtGui.QIcon(str(icons_path.joinpath('format-underline.svg')))
-        strikethrough_icon = QtGui.QIcon(str(icons_path.joinpath('format-strikethrough.svg')))
-        reset_icon = QtGui.QIcon(str(icons_path.joinpath('clear.svg')))
-        fonts_icon = QtGui.QIcon(str(icons_path.joinpath('fonts.svg')))
+        text_color_icon = self._icon('format-color-text.svg')
+        palette_icon = self._icon('palette.svg')
+        bold_icon = self._icon('format-bold.svg')
+        italic_icon = self._icon('format-italic.svg')
+        underline_icon = self._icon('format-underline.svg')
+        strikethrough_icon = self._icon('format-strikethrough.svg')
+        reset_icon = self._icon('clear.svg')
+        fonts_icon = self._icon('fonts.svg')
 
         self.text_color_btn = self.add_button(
             "",
@@ -83,15 +127,17 @@ class TextFloatingMenu(FloatingMenu):
         self.font_combo = QtWidgets.QComboBox(self)
         self.font_combo.setObjectName("FloatingMenuFontFamily")
         self.font_combo.setMinimumWidth(40)
-        self.font_combo.setIconSize(QtCore.QSize(32, 32))
+        self.font_combo.setIconSize(self.ICON_SIZE)
         self.font_combo.setEditable(False)
         self.font_combo.setInsertPolicy(
             QtWidgets.QComboBox.InsertPolicy.NoInsert)
-        families = QtGui.QFontDatabase.families()
-        self.font_combo.addItems(families)
-        # Add icon to all font items
-        for i in range(self.font_combo.count()):
-            self.font_combo.setItemIcon(i, fonts_icon)
+        # Icons are supplied lazily by the proxy instead of per item
+        proxy = _FontIconProxy(fonts_icon, self.font_combo)
+        proxy.setSourceModel(QtCore.QStringListModel(_get_families(), proxy))
+        self.font_combo.setModel(proxy)
+        self._family_index: dict[str, int] = {}
+        for i, family in enumerate(_get_families()):
+            self._family_index.setdefault(_normalize_family(family), i)
         self.font_combo.currentTextChanged.connect(self._on_font_changed)
         self.add_widget(self.font_combo)
 
@@ -103,11 +149,27 @@ class TextFloatingMenu(FloatingMenu):
             callback=self.view.reset_selected_text_format,
         )
 
+    @classmethod
+    def _icon(cls, name: str) -> QtGui.QIcon:
+        icon = cls._ICON_CACHE.get(name)
+        if icon is None:
+            # Rasterize the SVG once at button size instead of on each paint
+            path = BeeAssets.PATH.joinpath('icons', name)
+            pixmap = QtGui.QIcon(str(path)).pixmap(cls.ICON_SIZE)
+            icon = QtGui.QIcon(pixmap)
+            cls._ICON_CACHE[name] = icon
+        return icon
+
     # ------------------------------------------------------------------
     def show_for_item(self, item: "BeeTextItem") -> None:
         font = item.font()
-        self._update_font_controls(font)
-        self._update_colors(item)
+        bg_color = getattr(item, "background_color", None) or QtGui.QColor()
+        state = (id(item), font.toString(),
+                 item.defaultTextColor().rgba(), bg_color.rgba())
+        if state != self._last_state:
+            self._last_state = state
+            self._update_font_controls(font)
+            self._update_colors(item)
         super().show_for_item(item)
 
     # UI updates -------------------------------------------------------
@@ -121,36 +183,57 @@ class TextFloatingMenu(FloatingMenu):
         if size == -1:
             size = int(font.pointSizeF())
 
-        try:
-            index = self.FONT_SIZES.index(size)
-        except ValueError:
-            index = -1
+        index = self._SIZE_INDEX.get(size, -1)
+        custom_index = len(self.FONT_SIZES)
         self.size_combo.blockSignals(True)
         if index >= 0:
+            self.size_combo.removeItem(custom_index)
             self.size_combo.setCurrentIndex(index)
         else:
-            self.size_combo.setCurrentText(str(size))
+            # The combo isn't editable, so show a custom size as an
+            # extra entry after the standard sizes
+            if self.size_combo.count() > custom_index:
+                self.size_combo.setItemText(custom_index, str(size))
+                self.size_combo.setItemData(custom_index, size)
+            else:
+                self.size_combo.addItem(str(size), size)
+            self.size_combo.setCurrentIndex(custom_index)
         self.size_combo.blockSignals(False)
 
         self.font_combo.blockSignals(True)
         family = font.family()
-        index = self.font_combo.findText(family)
+        index = self._family_index.get(_normalize_family(family), -1)
         if index >= 0:
             self.font_combo.setCurrentIndex(index)
         self.font_combo.blockSignals(False)
 
     def _update_colors(self, item: "BeeTextItem") -> None:
         text_color = item.defaultTextColor()
-        self.text_color_btn.setProperty(
-            "active", "true" if text_color else "false")
-        self.text_color_btn.style().unpolish(self.text_color_btn)
-        self.text_color_btn.style().polish(self.text_color_btn)
-
         bg_color = getattr(item, "background_color", None)
-        self.background_btn.setProperty(
-            "active", "true" if bg_color and bg_color.alpha() > 0 else "false")
-        self.background_btn.style().unpolish(self.background_btn)
-        self.background_btn.style().polish(self.background_btn)
+        self._pending_colors = (
+            bool(text_color),
+            bool(bg_color and bg_color.alpha() > 0))
+        if not self._color_refresh_timer.isActive():
+            self._color_refresh_timer.start()
+
+    def _apply_color_refresh(self) -> None:
+        if self._pending_colors is None:
+            return
+        text_active, bg_active = self._pending_colors
+        self._pending_colors = None
+
+        if text_active != self._text_color_active:
+            self._text_color_active = text_active
+            self._set_active(self.text_color_btn, text_active)
+
+        if bg_active != self._bg_active:
+            self._bg_active = bg_active
+            self._set_active(self.background_btn, bg_active)
+
+    def _set_active(self, button: QtWidgets.QWidget, active: bool) -> None:
+        button.setProperty("active", "true" if active else "false")
+        button.style().unpolish(button)
+        button.style().polish(button)
 
     # Slots ------------------------------------------------------------
     def _on_text_color_clicked(self) -> None:
@@ -29,24 +29,58 @@ from beeref.main_controls import MainControlsMixin
 
 logger = logging.getLogger(__name__)
 
+# File dialog filter for the Browse button, filled in with image formats
+_FILE_FILTER = ';;'.join((
+    'All Supported Files (*.bee {formats})',
+    f'{constants.APPNAME} File (*.bee)',
+    'Images ({formats})',
+    'All Files (*)'))
+
 
 class RecentFilesModel(QtCore.QAbstractListModel):
     """An entry in the 'Recent Files' list."""
 
+    _UNDERLINE_FONT = QtGui.QFont()
+    _UNDERLINE_FONT.setUnderline(True)
+
     def __init__(self, files):
         super().__init__()
-        self.files = files
+        self.files = list(files)
+        self._basenames = [os.path.basename(f) for f in files]
+
+    def set_files(self, files):
+        if files == self.files:
+            return
+
+        count = len(files)
+        if count and files[1:] == self.files[:count - 1]:
+            # Common case: one file was opened and moved to the top,
+            # possibly pushing older ones out at the bottom
+            if len(self.files) > count - 1:
+                self.beginRemoveRows(
+                    QtCore.QModelIndex(), count - 1, len(self.files) - 1)
+                del self.files[count - 1:]
+                del self._basenames[count - 1:]
+                self.endRemoveRows()
+            self.beginInsertRows(QtCore.QModelIndex(), 0, 0)
+            self.files.insert(0, files[0])
+            self._basenames.insert(0, os.path.basename(files[0]))
+            self.endInsertRows()
+            return
+
+        self.beginResetModel()
+        self.files = list(files)
+        self._basenames = [os.path.basename(f) for f in files]
+        self.endResetModel()
 
     def rowCount(self, parent):
         return len(self.files)
 
     def data(self, index, role):
         if role == QtCore.Qt.ItemDataRole.DisplayRole:
-            return os.path.basename(self.files[index.row()])
+            return self._basenames[index.row()]
         if role == QtCore.Qt.ItemDataRole.FontRole:
-            font = QtGui.QFont()
-            font.setUnderline(True)
-            return font
+            return self._UNDERLINE_FONT
 
 
 class RecentFilesView(QtWidgets.QListView):
@@ -56,36 +90,52 @@ class RecentFilesView(QtWidgets.QListView):
         self.view = view
         self.files = files or []
         self.clicked.connect(self.on_clicked)
-        self.setModel(RecentFilesModel(self.files))
+        self._model = RecentFilesModel(self.files)
+        self.setModel(self._model)
         self.setMouseTracking(True)
+        self._cursor_over_item = None
+        # All rows are single file names, so one row's size fits all
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+        self.setBatchSize(64)
+        self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred,
+                           QtWidgets.QSizePolicy.Policy.Fixed)
 
     def on_clicked(self, index):
         self.view.open_from_file(self.files[index.row()])
 
     def update_files(self, files):
         self.files = files or []
-        self.setModel(RecentFilesModel(self.files))
+        self._model.set_files(self.files)
         self.updateGeometry()
 
     def sizeHint(self):
         size = QtCore.QSize()
         if not self.files:
             return size
-        height = sum(
-            (self.sizeHintForRow(i) + 2) for i in range(len(self.files)))
-        width = max(self.sizeHintForColumn(i) for i in range(len(self.files)))
-        size.setHeight(height)
-        size.setWidth(width + 2)
+        # Nothing to measure while the files container is hidden
+        parent = self.parentWidget()
+        if parent is not None and not parent.isWindow() and parent.isHidden():
+            return size
+        count = len(self.files)
+        size.setHeight((self.sizeHintForRow(0) + 2) * count)
+        size.setWidth(self.sizeHintForColumn(0) + 2)
         return size
 
+    def minimumSizeHint(self):
+        return QtCore.QSize()
+
     def mouseMoveEvent(self, event):
         index = self.indexAt(
             QtCore.QPoint(int(event.position().x()),
                           int(event.position().y())))
-        if index.isValid():
-            self.setCursor(Qt.CursorShape.PointingHandCursor)
-        else:
-            self.setCursor(Qt.CursorShape.ArrowCursor)
+        over_item = index.isValid()
+        if over_item != self._cursor_over_item:
+            self._cursor_over_item = over_item
+            if over_item:
+                self.setCursor(Qt.CursorShape.PointingHandCursor)
+            else:
+                self.setCursor(Qt.CursorShape.ArrowCursor)
 
         super().mouseMoveEvent(event)
 
@@ -96,12 +146,23 @@ class WelcomeOverlay(MainControlsMixin, QtWidgets.QWidget):
     def __init__(self, parent):
         super().__init__(parent)
         self.control_target = parent
+        self._built = False
+        self._mouse_enabled = True
+        self._mouse_widgets = ()
         self.setAutoFillBackground(True)
         self.init_main_controls(main_window=parent.parent)
+        # Stay hidden (and unbuilt) until the view finds the scene empty
+        self.hide()
+
+    def _build_ui(self):
+        """Create the child widgets; deferred until the overlay is shown."""
+        if self._built:
+            return
+        self._built = True
+        parent = self.control_target
 
         # Icon
-        icon_path = BeeAssets.PATH.joinpath('icons','drag-and-drop.svg')
-        icon_pixmap = QtGui.QPixmap(str(icon_path))
+        icon_pixmap = BeeAssets().icon_pixmap('drag-and-drop.svg')
         self.icon_label = QtWidgets.QLabel(self)
         self.icon_label.setPixmap(icon_pixmap)
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -134,65 +195,51 @@ class WelcomeOverlay(MainControlsMixin, QtWidgets.QWidget):
         self.files_widget.setLayout(files_layout)
         self.files_widget.hide()
 
-        # Center content widget
-        center_widget = QtWidgets.QWidget(self)
-        center_layout = QtWidgets.QVBoxLayout()
-        center_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        center_layout.addStretch()
-        center_layout.addWidget(self.icon_label)
-        center_layout.addWidget(self.label)
-        center_layout.addWidget(self.right_click_label)
-        center_layout.addWidget(self.browse_button)
-        center_layout.setAlignment(self.browse_button, Qt.AlignmentFlag.AlignHCenter)
-        center_layout.addWidget(self.files_widget)
-        center_layout.addStretch()
-        center_widget.setLayout(center_layout)
-
-        self.layout = QtWidgets.QHBoxLayout()
-        self.layout.addStretch()
-        self.layout.addWidget(center_widget)
-        self.layout.addStretch()
+        # Content is centered in column 1, between stretching rows
+        # and columns
+        self.layout = QtWidgets.QGridLayout()
+        self.layout.setRowStretch(0, 1)
+        self.layout.addWidget(self.icon_label, 1, 1)
+        self.layout.addWidget(self.label, 2, 1)
+        self.layout.addWidget(self.right_click_label, 3, 1)
+        self.layout.addWidget(self.browse_button, 4, 1,
+                              Qt.AlignmentFlag.AlignHCenter)
+        self.layout.addWidget(self.files_widget, 5, 1)
+        self.layout.setRowStretch(6, 1)
+        self.layout.setColumnStretch(0, 1)
+        self.layout.setColumnStretch(2, 1)
         self.setLayout(self.layout)
 
+        self._mouse_widgets = (
+            self.icon_label, self.label, self.right_click_label,
+            self.browse_button, self.files_view, self.files_widget)
+
+    def showEvent(self, event):
+        self._build_ui()
+        super().showEvent(event)
+
     def show(self):
+        self._build_ui()
         files = BeeSettings().get_recent_files(existing_only=True)
-        self.files_view.update_files(files)
+        # Show the container first so the list measures its real size
         self.files_widget.setVisible(bool(files))
+        self.files_view.update_files(files)
         super().show()
 
     def disable_mouse_events(self):
-        self.icon_label.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.label.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.right_click_label.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.browse_button.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.files_view.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.files_widget.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self._set_mouse_events(False)
 
     def enable_mouse_events(self):
-        self.icon_label.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents,
-            on=False)
-        self.label.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents,
-            on=False)
-        self.right_click_label.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents,
-            on=False)
-        self.browse_button.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents,
-            on=False)
-        self.files_view.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents,
-            on=False)
-        self.files_widget.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents,
-            on=False)
+        self._set_mouse_events(True)
+
+    def _set_mouse_events(self, enabled):
+        if enabled == self._mouse_enabled:
+            return
+        self._mouse_enabled = enabled
+        for widget in self._mouse_widgets:
+            widget.setAttribute(
+                Qt.WidgetAttribute.WA_TransparentForMouseEvents,
+                on=not enabled)
 
     def mousePressEvent(self, event):
         if self.mousePressEventMainControls(event):
@@ -220,17 +267,11 @@ class WelcomeOverlay(MainControlsMixin, QtWidgets.QWidget):
             return
         
         # Get supported image formats
-        formats = self.control_target.get_supported_image_formats(QtGui.QImageReader)
-        
-        # Create filter string for file dialog
+        formats = self.control_target.get_supported_image_formats(
+            QtGui.QImageReader)
+
         # First option: All supported files (bee + images)
-        all_formats = f'*.bee {formats}'
-        filter_str = ';;'.join((
-            f'All Supported Files ({all_formats})',
-            f'{constants.APPNAME} File (*.bee)',
-            f'Images ({formats})',
-            'All Files (*)'
-        ))
+        filter_str = _FILE_FILTER.format(formats=formats)
         
         # Open file dialog allowing multiple selection
         filenames, selected_filter = QtWidgets.QFileDialog.getOpenFileNames(
@@ -242,8 +283,9 @@ class WelcomeOverlay(MainControlsMixin, QtWidgets.QWidget):
             return
         
         # Check if any selected file is a .bee file
-        bee_files = [f for f in filenames if fileio.is_bee_file(f)]
-        image_files = [f for f in filenames if not fileio.is_bee_file(f)]
+        bee_files, image_files = [], []
+        for f in filenames:
+            (bee_files if fileio.is_bee_file(f) else image_files).append(f)
         
         # If we have .bee files, open the first one (clear scene first)
         if bee_files:
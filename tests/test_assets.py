@@ -10,3 +10,10 @@ def test_singleton(view):
 
 def test_has_logo(view):
     assert isinstance(BeeAssets().logo, QtGui.QIcon)
+
+
+def test_icon_pixmap(view):
+    pixmap = BeeAssets().icon_pixmap('drag-and-drop.svg')
+    assert isinstance(pixmap, QtGui.QPixmap)
+    assert pixmap.isNull() is False
+    assert BeeAssets().icon_pixmap('drag-and-drop.svg') is pixmap
@@ -73,12 +73,34 @@ def test_on_scene_changed_when_no_items(show_mock, view):
         assert view.get_scale() == 1
 
 
+@patch('beeref.widgets.welcome_overlay.WelcomeOverlay.show')
+def test_on_scene_changed_when_no_items_and_loading(show_mock, view):
+    view.loading = True
+    view.on_scene_changed(None)
+    show_mock.assert_not_called()
+
+
+@patch('beeref.widgets.welcome_overlay.WelcomeOverlay.show')
+@patch('PyQt6.QtWidgets.QMessageBox.warning')
+def test_on_loading_finished_when_error_shows_welcome_overlay(
+        warning_mock, show_mock, view):
+    view.loading = True
+    view.on_loading_finished('foo.bee', ['error'])
+    assert view.loading is False
+    show_mock.assert_called_once_with()
+
+
 def test_get_supported_image_formats_for_reading(view):
     formats = view.get_supported_image_formats(QtGui.QImageReader)
     assert '*.png' in formats
     assert '*.jpg' in formats
 
 
+def test_get_supported_image_formats_is_cached(view):
+    formats = view.get_supported_image_formats(QtGui.QImageReader)
+    assert view.get_supported_image_formats(QtGui.QImageReader) is formats
+
+
 def test_clear_scene(view, item):
     view.scene.addItem(item)
     view.scene.internal_clipboard.append(item)
@@ -955,12 +977,14 @@ def test_on_action_show_titlebar_unchecked(
 def test_on_action_move_window_when_welcome_overlay(cursor_mock, view):
     cursor_mock.return_value = MagicMock(
         pos=MagicMock(return_value=QtCore.QPointF(10.0, 20.0)))
+    view.welcome_overlay.show()
     view.on_action_move_window()
     assert view.welcome_overlay.movewin_active is True
     assert view.welcome_overlay.event_start == QtCore.QPointF(10.0, 20.0)
 
 
 def test_on_action_move_window_when_already_active(view):
+    view.welcome_overlay.show()
     view.welcome_overlay.event_start = QtCore.QPointF(10.0, 20.0)
     view.welcome_overlay.movewin_active = True
     view.on_action_move_window()
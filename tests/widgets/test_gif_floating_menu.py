@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock
+
+from PyQt6 import QtWidgets
+
+from beeref.items import BeeGifItem
+from beeref.widgets.gif_floating_menu import GifFloatingMenu
+from beeref.widgets.gif_frames_menu import GifFramesMenu
+
+
+def make_menu(view):
+    return GifFloatingMenu(view.parent, view)
+
+
+def test_frames_menu_not_created_by_show_hide_or_update(view):
+    menu = make_menu(view)
+    menu.show_for_item(BeeGifItem())
+    menu.update_position()
+    menu.hide_menu()
+    assert menu._frames_menu is None
+
+
+def test_frames_menu_created_on_toggle(view):
+    menu = make_menu(view)
+    menu.show_for_item(BeeGifItem())
+    menu.on_toggle_frames_menu()
+    assert isinstance(menu._frames_menu, GifFramesMenu)
+
+
+def test_on_next_frame_deferred_until_events_processed(view):
+    menu = make_menu(view)
+    item = BeeGifItem()
+    item.next_frame = MagicMock()
+    item.current_frame = 2
+    menu.show_for_item(item)
+    menu._frames_menu = MagicMock()
+    menu._frames_menu.isVisible.return_value = True
+    menu.on_next_frame()
+    item.next_frame.assert_not_called()
+    QtWidgets.QApplication.processEvents()
+    item.next_frame.assert_called_once_with()
+    menu._frames_menu.update_selected_frame.assert_called_once_with(2)
+
+
+def test_has_gif_item(view, item):
+    menu = make_menu(view)
+    assert menu._has_gif_item() is False
+    menu.current_item = item
+    assert menu._has_gif_item() is False
+    menu.current_item = BeeGifItem()
+    assert menu._has_gif_item() is True
@@ -0,0 +1,98 @@
+from unittest.mock import MagicMock, patch
+
+from PyQt6 import QtCore, QtGui
+
+from beeref.widgets.gif_floating_menu import GifFloatingMenu
+from beeref.widgets.gif_frames_menu import (
+    GifFramesMenu,
+    GifFramesModel,
+    GifFramesView,
+)
+
+
+def make_pixmap(color='red'):
+    pixmap = QtGui.QPixmap(20, 10)
+    pixmap.fill(QtGui.QColor(color))
+    return pixmap
+
+
+def make_model(count=3, selected_frame=0):
+    model = GifFramesModel()
+    pixmaps = [make_pixmap() for i in range(count)]
+    model.set_frames(pixmaps, pixmaps, [100] * count, selected_frame)
+    return model
+
+
+def test_gif_frames_model_set_frames(view):
+    model = make_model(count=3)
+    assert model.rowCount() == 3
+    assert model.data(model.index(1)) == '2'
+    assert model.data(model.index(0), GifFramesModel.SelectedRole) is True
+    assert model.data(model.index(1), GifFramesModel.SelectedRole) is False
+
+
+def test_gif_frames_model_clear(view):
+    model = make_model(count=3)
+    model.clear()
+    assert model.rowCount() == 0
+    assert model.selected_frame == -1
+
+
+def test_gif_frames_model_set_selected_frame(view):
+    model = make_model(count=5, selected_frame=1)
+    changed = MagicMock()
+    model.dataChanged.connect(changed)
+    model.set_selected_frame(3)
+    assert model.selected_frame == 3
+    assert changed.call_count == 2
+    rows = [call.args[0].row() for call in changed.call_args_list]
+    assert rows == [1, 3]
+    for call in changed.call_args_list:
+        assert call.args[1] == call.args[0]
+        assert call.args[2] == [GifFramesModel.SelectedRole]
+
+
+def test_gif_frames_model_set_selected_frame_when_unchanged(view):
+    model = make_model(count=5, selected_frame=1)
+    changed = MagicMock()
+    model.dataChanged.connect(changed)
+    model.set_selected_frame(1)
+    changed.assert_not_called()
+
+
+def test_gif_frames_model_flags_drag_enabled(view):
+    model = GifFramesModel()
+    model.set_frames([make_pixmap(), QtGui.QPixmap()],
+                     [make_pixmap(), QtGui.QPixmap()], [100, 100], 0)
+    drag_flag = QtCore.Qt.ItemFlag.ItemIsDragEnabled
+    assert model.flags(model.index(0)) & drag_flag
+    assert not model.flags(model.index(1)) & drag_flag
+
+
+def test_gif_frames_model_mime_data_has_full_size_frame(view):
+    model = GifFramesModel()
+    pixmap = make_pixmap()
+    thumbnail = pixmap.scaled(4, 2)
+    model.set_frames([pixmap], [thumbnail], [100], 0)
+    mime_data = model.mimeData([model.index(0)])
+    assert mime_data.hasImage()
+    assert mime_data.imageData().size() == pixmap.size()
+
+
+def test_gif_frames_view_on_clicked_selects_frame(view):
+    frames_menu = MagicMock()
+    frames_view = GifFramesView(frames_menu)
+    model = make_model(count=3)
+    frames_view.setModel(model)
+    frames_view.on_clicked(model.index(2))
+    frames_menu.select_frame.assert_called_once_with(3)
+
+
+def test_gif_frames_menu_update_position_skips_when_unchanged(view):
+    gif_menu = GifFloatingMenu(view.parent, view)
+    frames_menu = GifFramesMenu(view.parent, view, gif_menu)
+    frames_menu.show()
+    frames_menu.update_position()
+    with patch.object(frames_menu, 'setGeometry') as geometry_mock:
+        frames_menu.update_position()
+    geometry_mock.assert_not_called()
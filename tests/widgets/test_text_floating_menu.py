@@ -0,0 +1,116 @@
+from unittest.mock import MagicMock, patch
+
+from PyQt6 import QtGui, QtWidgets
+
+from beeref.items import BeeTextItem
+from beeref.widgets.text_floating_menu import TextFloatingMenu
+
+
+def make_menu(view):
+    return TextFloatingMenu(view.parent, view)
+
+
+def test_icon_shared_across_instances(view):
+    first = make_menu(view)
+    icon = TextFloatingMenu._icon('format-bold.svg')
+    second = make_menu(view)
+    assert TextFloatingMenu._icon('format-bold.svg') is icon
+    assert (first.bold_btn.icon().cacheKey()
+            == second.bold_btn.icon().cacheKey())
+
+
+def test_update_font_controls_custom_size_keeps_text(view):
+    menu = make_menu(view)
+    font = QtGui.QFont()
+    font.setPointSize(13)
+    menu._update_font_controls(font)
+    assert menu.size_combo.currentText() == '13'
+    assert menu.size_combo.currentData() == 13
+
+    font.setPointSize(24)
+    menu._update_font_controls(font)
+    assert menu.size_combo.currentText() == '24'
+    assert menu.size_combo.count() == len(TextFloatingMenu.FONT_SIZES)
+
+
+def test_show_for_item_skips_refresh_when_state_unchanged(view):
+    menu = make_menu(view)
+    item = BeeTextItem('foo')
+    with patch.object(menu, '_update_font_controls') as font_mock:
+        menu.show_for_item(item)
+        menu.show_for_item(item)
+    font_mock.assert_called_once()
+
+
+def test_show_for_item_refreshes_when_font_changes(view):
+    menu = make_menu(view)
+    item = BeeTextItem('foo')
+    menu.show_for_item(item)
+    font = item.font()
+    font.setItalic(True)
+    item.setFont(font)
+    menu.show_for_item(item)
+    assert menu.italic_btn.isChecked() is True
+
+
+def test_show_for_item_refreshes_when_background_changes(view, qapp):
+    menu = make_menu(view)
+    item = BeeTextItem('foo')
+    menu.show_for_item(item)
+    qapp.processEvents()
+    assert menu.background_btn.property('active') == 'false'
+    item.set_background_color(QtGui.QColor(255, 0, 0))
+    menu.show_for_item(item)
+    qapp.processEvents()
+    assert menu.background_btn.property('active') == 'true'
+
+
+def test_text_floating_menu_created_on_first_text_selection(view):
+    assert view._text_floating_menu is None
+    item = BeeTextItem('foo')
+    view.scene.addItem(item)
+    assert view._text_floating_menu is None
+    item.setSelected(True)
+    QtWidgets.QApplication.processEvents()
+    assert isinstance(view._text_floating_menu, TextFloatingMenu)
+
+
+def test_update_font_controls_matches_normalized_family(view):
+    menu = make_menu(view)
+    family = menu.font_combo.itemText(menu.font_combo.count() - 1)
+    font = QtGui.QFont()
+    font.setFamily(f' {family.upper().replace(" ", "")} ')
+    menu._update_font_controls(font)
+    assert (menu.font_combo.currentText().casefold().replace(' ', '')
+            == family.casefold().replace(' ', ''))
+
+
+def test_apply_color_refresh_polishes_only_when_state_flips(view):
+    menu = make_menu(view)
+    menu._set_active = MagicMock()
+    menu._pending_colors = (True, False)
+    menu._apply_color_refresh()
+    assert menu._set_active.call_count == 2
+
+    menu._set_active.reset_mock()
+    menu._pending_colors = (True, False)
+    menu._apply_color_refresh()
+    menu._set_active.assert_not_called()
+
+    menu._pending_colors = (True, True)
+    menu._apply_color_refresh()
+    menu._set_active.assert_called_once_with(menu.background_btn, True)
+
+
+def test_update_colors_coalesces_into_one_refresh(view, qapp):
+    menu = make_menu(view)
+    menu._set_active = MagicMock()
+    item = BeeTextItem('foo')
+    item.set_background_color(QtGui.QColor(255, 0, 0))
+    menu._update_colors(item)
+    item.set_background_color(QtGui.QColor(0, 0, 0, 0))
+    menu._update_colors(item)
+    menu._set_active.assert_not_called()
+    qapp.processEvents()
+    menu._set_active.assert_any_call(menu.background_btn, False)
+    assert menu._bg_active is False
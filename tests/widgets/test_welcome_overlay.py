@@ -1,3 +1,4 @@
+import os.path
 from unittest.mock import MagicMock, patch
 
 from PyQt6 import QtCore, QtWidgets
@@ -37,7 +38,53 @@ def test_welcome_overlay_when_no_recent_files(qapp):
     view = BeeGraphicsView(qapp, parent)
     overlay = WelcomeOverlay(view)
     overlay.show()
-    assert overlay.layout.indexOf(overlay.files_widget) < 0
+    assert overlay.layout.indexOf(overlay.files_widget) >= 0
+    assert overlay.files_widget.isHidden() is True
+
+
+def test_recent_files_model_set_files(view):
+    model = RecentFilesModel(['foo.png'])
+    model.set_files(['/a/bar.png', '/b/baz.png'])
+    assert model.rowCount(None) == 2
+    index = MagicMock()
+    index.row.return_value = 1
+    assert model.data(index, QtCore.Qt.ItemDataRole.DisplayRole) == 'baz.png'
+
+
+def test_recent_files_model_set_files_prepends_incrementally(view):
+    model = RecentFilesModel(['/a/foo.png', '/a/bar.png', '/a/baz.png'])
+    reset = MagicMock()
+    inserted = MagicMock()
+    removed = MagicMock()
+    model.modelReset.connect(reset)
+    model.rowsInserted.connect(inserted)
+    model.rowsRemoved.connect(removed)
+    model.set_files(['/b/new.png', '/a/foo.png', '/a/bar.png'])
+    assert model.files == ['/b/new.png', '/a/foo.png', '/a/bar.png']
+    index = MagicMock()
+    index.row.return_value = 0
+    assert model.data(index, QtCore.Qt.ItemDataRole.DisplayRole) == 'new.png'
+    reset.assert_not_called()
+    assert inserted.call_args.args[1:] == (0, 0)
+    assert removed.call_args.args[1:] == (2, 2)
+
+
+def test_recent_files_model_set_files_resets_unrelated_list(view):
+    model = RecentFilesModel(['/a/foo.png', '/a/bar.png'])
+    reset = MagicMock()
+    model.modelReset.connect(reset)
+    model.set_files(['/c/x.png', '/c/y.png'])
+    assert model.files == ['/c/x.png', '/c/y.png']
+    reset.assert_called_once_with()
+
+
+def test_recent_files_view_update_files_keeps_model(qapp):
+    parent = QtWidgets.QMainWindow()
+    files_view = RecentFilesView(parent, None)
+    model = files_view.model()
+    files_view.update_files(['foo.png', 'bar.png'])
+    assert files_view.model() is model
+    assert model.rowCount(None) == 2
 
 
 def test_recent_files_view_size_hint(qapp):
@@ -47,7 +94,16 @@ def test_recent_files_view_size_hint(qapp):
     files_view.sizeHintForRow = lambda i: 10 + i
     files_view.sizeHintForColumn = lambda i: 50 + i
     files_view.update_files(['foo.png', 'bar.png'])
-    assert files_view.sizeHint() == QtCore.QSize(53, 25)
+    assert files_view.sizeHint() == QtCore.QSize(52, 24)
+
+
+def test_recent_files_view_size_hint_when_container_hidden(qapp):
+    parent = QtWidgets.QMainWindow()
+    container = QtWidgets.QWidget(parent)
+    files_view = RecentFilesView(container, None)
+    files_view.update_files(['foo.png', 'bar.png'])
+    container.hide()
+    assert files_view.sizeHint() == QtCore.QSize()
 
 
 def test_recent_files_view_on_click(qapp):
@@ -55,6 +111,7 @@ def test_recent_files_view_on_click(qapp):
     view = BeeGraphicsView(qapp, parent)
     view.open_from_file = MagicMock()
     overlay = WelcomeOverlay(view)
+    overlay.show()
     overlay.files_view.update_files(['foo.bee', 'bar.bee'])
     overlay.files_view.on_clicked(
         RecentFilesModel(
@@ -69,7 +126,43 @@ def test_welcome_overlay_when_recent_files(qapp):
     view = BeeGraphicsView(qapp, parent)
     overlay = WelcomeOverlay(view)
     overlay.show()
-    assert overlay.layout.indexOf(overlay.files_widget) == 0
+    assert overlay.layout.indexOf(overlay.files_widget) >= 0
+    assert overlay.files_widget.isHidden() is False
+
+
+def test_welcome_overlay_builds_ui_on_first_show(qapp):
+    parent = QtWidgets.QMainWindow()
+    view = BeeGraphicsView(qapp, parent)
+    overlay = WelcomeOverlay(view)
+    assert overlay.isHidden() is True
+    assert overlay._built is False
+    overlay.show()
+    files_view = overlay.files_view
+    overlay.hide()
+    overlay.show()
+    assert overlay.files_view is files_view
+
+
+def test_welcome_overlay_not_built_when_opening_file_on_startup(
+        qapp, qtbot, commandline_args):
+    from beeref.__main__ import BeeRefMainWindow
+    root = os.path.dirname(os.path.dirname(__file__))
+    commandline_args.filenames = [
+        os.path.join(root, 'assets', 'test1item.bee')]
+    main = BeeRefMainWindow(qapp)
+    qtbot.addWidget(main)
+    main.view.worker.wait()
+    qtbot.waitUntil(lambda: main.view.loading is False)
+    QtWidgets.QApplication.processEvents()
+    assert len(main.view.scene.items()) == 1
+    assert main.view.welcome_overlay.isHidden() is True
+    assert main.view.welcome_overlay._built is False
+
+
+def test_welcome_overlay_shown_when_scene_empty(main_window):
+    main_window.show()
+    QtWidgets.QApplication.processEvents()
+    assert main_window.view.welcome_overlay.isVisible() is True
 
 
 @patch('PyQt6.QtWidgets.QGraphicsView.mousePressEvent')
@@ -81,3 +174,51 @@ def test_mouse_press_when_move_window_active(mouse_event_mock, qapp):
     overlay.mousePressEvent(MagicMock())
     assert overlay.movewin_active is False
     mouse_event_mock.assert_not_called()
+
+
+@patch('PyQt6.QtWidgets.QFileDialog.getOpenFileNames',
+       return_value=([], None))
+def test_on_browse_clicked_filter(dialog_mock, qapp):
+    parent = QtWidgets.QMainWindow()
+    view = BeeGraphicsView(qapp, parent)
+    view.get_supported_image_formats = MagicMock(return_value='*.png')
+    overlay = WelcomeOverlay(view)
+    overlay.on_browse_clicked()
+    assert dialog_mock.call_args.kwargs['filter'] == (
+        'All Supported Files (*.bee *.png);;BeeRef File (*.bee);;'
+        'Images (*.png);;All Files (*)')
+
+
+def test_welcome_overlay_disable_enable_mouse_events(qapp):
+    parent = QtWidgets.QMainWindow()
+    view = BeeGraphicsView(qapp, parent)
+    overlay = WelcomeOverlay(view)
+    overlay.show()
+    attr = QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents
+    overlay.disable_mouse_events()
+    assert overlay.files_view.testAttribute(attr) is True
+    assert overlay.browse_button.testAttribute(attr) is True
+    overlay.enable_mouse_events()
+    assert overlay.files_view.testAttribute(attr) is False
+    assert overlay.browse_button.testAttribute(attr) is False
+
+
+def test_recent_files_view_mouse_move_sets_cursor_on_change(qapp):
+    parent = QtWidgets.QMainWindow()
+    files_view = RecentFilesView(parent, None)
+    files_view.update_files(['foo.png'])
+    files_view.setCursor = MagicMock()
+    event = MagicMock()
+    event.position.return_value = QtCore.QPointF(5, 5)
+    with patch('PyQt6.QtWidgets.QListView.mouseMoveEvent'):
+        with patch.object(files_view, 'indexAt') as index_mock:
+            index_mock.return_value.isValid.return_value = True
+            files_view.mouseMoveEvent(event)
+            files_view.mouseMoveEvent(event)
+            files_view.setCursor.assert_called_once_with(
+                QtCore.Qt.CursorShape.PointingHandCursor)
+            index_mock.return_value.isValid.return_value = False
+            files_view.mouseMoveEvent(event)
+    files_view.setCursor.assert_called_with(
+        QtCore.Qt.CursorShape.ArrowCursor)
+    assert files_view.setCursor.call_count == 2